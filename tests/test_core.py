@@ -0,0 +1,285 @@
+import json
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.webelement import WebElement
+
+from seleniumkit import core
+from seleniumkit.core import _normalize_locator
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class FakeExecutor:
+    """送信されたコマンドを記録し、登録された応答を返すcommand_executor。"""
+
+    def __init__(self, responses=None):
+        self.commands = []
+        self.responses = responses or {}
+
+    def execute(self, command, params):
+        self.commands.append(command)
+        value = self.responses.get(command)
+        if isinstance(value, dict) and "error" in value:
+            # RemoteConnectionと同じく、エラーはHTTPステータスとJSON文字列で返します
+            return {"status": 404, "value": json.dumps({"value": value})}
+        return {"value": value}
+
+
+NO_SUCH_ELEMENT = {"error": "no such element", "message": "not found"}
+
+
+def make_driver(cls=WebDriver, responses=None):
+    driver = cls.__new__(cls)
+    driver.session_id = "session"
+    driver.command_executor = FakeExecutor(responses)
+    driver.error_handler = ErrorHandler()
+    driver._web_element_cls = WebElement
+    return driver
+
+
+def make_pooled_driver(responses=None):
+    driver = make_driver(core._PooledChrome, responses)
+    driver._implicit_wait = 0
+    return driver
+
+
+def test_normalize_locator_tag():
+    assert _normalize_locator(By.XPATH, "//div") == (By.CSS_SELECTOR, "div")
+    assert _normalize_locator(By.XPATH, "//*") == (By.CSS_SELECTOR, "*")
+
+
+def test_normalize_locator_id():
+    assert _normalize_locator(By.XPATH, "//input[@id='q']") == (
+        By.CSS_SELECTOR,
+        "input#q",
+    )
+    assert _normalize_locator(By.XPATH, '//*[@id="a b"]') == (
+        By.CSS_SELECTOR,
+        '[id="a b"]',
+    )
+
+
+def test_normalize_locator_single_quoted_value_keeps_quotes():
+    assert _normalize_locator(By.XPATH, """//a[@title='say "hi"']""") == (
+        By.CSS_SELECTOR,
+        """a[title='say "hi"']""",
+    )
+
+
+def test_normalize_locator_double_quoted_value_keeps_quotes():
+    assert _normalize_locator(By.XPATH, """//a[@title="it's"]""") == (
+        By.CSS_SELECTOR,
+        """a[title="it's"]""",
+    )
+
+
+def test_normalize_locator_passes_through_other_locators():
+    assert _normalize_locator(By.XPATH, "//div/span") == (By.XPATH, "//div/span")
+    assert _normalize_locator(By.ID, "q") == (By.ID, "q")
+
+
+def test_map_over_urls_releases_drivers_after_workers_finish(monkeypatch):
+    events = []
+    lock = threading.Lock()
+    counter = iter(range(100))
+
+    def fake_initialize_driver(headless):
+        with lock:
+            return next(counter)
+
+    def fake_release_driver(driver):
+        events.append(("release", driver))
+
+    def fn(driver, url):
+        if url == "bad":
+            raise ValueError(url)
+        time.sleep(0.05)
+        events.append(("done", url))
+
+    monkeypatch.setattr(core, "initialize_driver", fake_initialize_driver)
+    monkeypatch.setattr(core, "release_driver", fake_release_driver)
+
+    with pytest.raises(ValueError):
+        core.map_over_urls(["bad", "slow"], fn, max_workers=2)
+    assert events[0] == ("done", "slow")
+    assert sorted(events[1:]) == [("release", 0), ("release", 1)]
+
+
+def test_map_over_urls_with_no_urls_starts_no_driver(monkeypatch):
+    def fail(headless):
+        raise AssertionError("initialize_driver should not be called")
+
+    monkeypatch.setattr(core, "initialize_driver", fail)
+    assert core.map_over_urls([], lambda driver, url: url) == []
+
+
+def test_map_over_urls_releases_started_drivers_when_one_fails(monkeypatch):
+    released = []
+    lock = threading.Lock()
+    counter = iter(range(100))
+
+    def fake_initialize_driver(headless):
+        with lock:
+            driver = next(counter)
+        if driver == 1:
+            raise RuntimeError("failed to start")
+        return driver
+
+    monkeypatch.setattr(core, "initialize_driver", fake_initialize_driver)
+    monkeypatch.setattr(core, "release_driver", released.append)
+
+    with pytest.raises(RuntimeError):
+        core.map_over_urls(["a", "b", "c"], lambda driver, url: url, max_workers=3)
+    assert sorted(released) == [0, 2]
+
+
+def test_element_helpers_require_payload_argument():
+    element = WebElement(None, "element-id")
+    with pytest.raises(TypeError):
+        core.input_text(element, "hello")
+    with pytest.raises(TypeError):
+        core.select_from_dropdown(element, "option")
+    with pytest.raises(TypeError):
+        core.take_element_screenshot(element, "shot.png")
+
+
+def test_element_helpers_require_locator_for_driver():
+    driver = object()
+    with pytest.raises(TypeError):
+        core.input_text(driver, text="hello")
+    with pytest.raises(TypeError):
+        core.select_from_dropdown(driver, By.ID, option_text="option")
+    with pytest.raises(TypeError):
+        core.take_element_screenshot(driver, value="id", file_path="shot.png")
+
+
+def test_is_element_present_on_pooled_driver_sends_one_command():
+    driver = make_pooled_driver({"findElements": []})
+    assert core.is_element_present(driver, By.ID, "missing") is False
+    assert driver.command_executor.commands == ["findElements"]
+
+
+def test_is_element_present_with_timeout_restores_implicit_wait():
+    driver = make_pooled_driver({"findElements": [{ELEMENT_KEY: "e1"}]})
+    assert core.is_element_present(driver, By.ID, "found", timeout=2) is True
+    assert driver.command_executor.commands == [
+        "setTimeouts",
+        "findElements",
+        "setTimeouts",
+    ]
+    assert driver._implicit_wait == 0
+
+
+def test_is_element_present_after_direct_implicitly_wait_does_not_wait():
+    driver = make_pooled_driver({"w3cExecuteScript": False})
+    driver.implicitly_wait(10)
+    driver.command_executor.commands.clear()
+    assert core.is_element_present(driver, By.ID, "missing") is False
+    assert driver.command_executor.commands == ["w3cExecuteScript"]
+    assert driver._implicit_wait == 10
+
+
+def test_find_element_hit_on_pooled_driver_sends_one_command():
+    driver = make_pooled_driver({"findElements": [{ELEMENT_KEY: "e1"}]})
+    assert core.find_element(driver, By.ID, "found").id == "e1"
+    assert driver.command_executor.commands == ["findElements"]
+    assert driver._implicit_wait == 0
+
+
+def test_find_element_miss_waits_driver_side_and_restores():
+    driver = make_pooled_driver({"findElements": [], "findElement": NO_SUCH_ELEMENT})
+    with pytest.raises(NoSuchElementException):
+        core.find_element(driver, By.ID, "missing", timeout=3)
+    assert driver.command_executor.commands == [
+        "findElements",
+        "setTimeouts",
+        "findElement",
+        "setTimeouts",
+    ]
+    assert driver._implicit_wait == 0
+
+
+def test_find_element_with_matching_implicit_wait_sends_one_command():
+    driver = make_pooled_driver({"findElement": {ELEMENT_KEY: "e1"}})
+    driver.implicitly_wait(3)
+    driver.command_executor.commands.clear()
+    assert core.find_element(driver, By.ID, "found", timeout=3).id == "e1"
+    assert driver.command_executor.commands == ["findElement"]
+
+
+def test_find_element_hit_on_other_driver_sends_one_command():
+    driver = make_driver(responses={"findElements": [{ELEMENT_KEY: "e1"}]})
+    assert core.find_element(driver, By.ID, "found").id == "e1"
+    assert driver.command_executor.commands == ["findElements"]
+
+
+def test_find_element_accepts_web_element():
+    driver = make_driver(responses={"findChildElements": [{ELEMENT_KEY: "e2"}]})
+    parent = WebElement(driver, "e1")
+    assert core.find_element(parent, By.ID, "child").id == "e2"
+    assert driver.command_executor.commands == ["findChildElements"]
+
+
+def test_is_element_present_on_other_driver_sends_one_command():
+    driver = make_driver(responses={"w3cExecuteScript": False})
+    assert core.is_element_present(driver, By.ID, "missing") is False
+    assert driver.command_executor.commands == ["w3cExecuteScript"]
+
+
+def test_is_element_present_link_text_on_other_driver_manages_wait():
+    driver = make_driver(
+        responses={"getTimeouts": {"implicit": 0, "pageLoad": 0, "script": 0}}
+    )
+    driver.command_executor.responses["findElements"] = []
+    assert core.is_element_present(driver, By.LINK_TEXT, "Next") is False
+    assert driver.command_executor.commands == [
+        "getTimeouts",
+        "setTimeouts",
+        "findElements",
+        "setTimeouts",
+    ]
+
+
+def test_input_text_sets_value_with_one_script_call():
+    driver = make_driver(responses={"w3cExecuteScript": True})
+    core.input_text(WebElement(driver, "e1"), text="hello")
+    assert driver.command_executor.commands == ["w3cExecuteScript"]
+
+
+def test_input_text_falls_back_to_send_keys_for_unsupported_elements():
+    driver = make_driver(responses={"w3cExecuteScript": False})
+    driver._is_remote = False
+    core.input_text(WebElement(driver, "e1"), text="/tmp/upload.txt")
+    assert driver.command_executor.commands == [
+        "w3cExecuteScript",
+        "clearElement",
+        "sendKeysToElement",
+    ]
+
+
+def test_release_driver_quits_drivers_not_from_the_pool(monkeypatch):
+    monkeypatch.setattr(core, "_POOLS", {})
+    driver = make_driver()
+    quit_calls = []
+    driver.quit = lambda: quit_calls.append(driver)
+    core.release_driver(driver)
+    assert quit_calls == [driver]
+    assert core._POOLS == {}
+
+
+def test_initialize_driver_discards_dead_pooled_sessions(monkeypatch):
+    monkeypatch.setattr(core, "_POOLS", {})
+    dead = make_pooled_driver(
+        {"w3cGetCurrentWindowHandle": {"error": "invalid session id", "message": ""}}
+    )
+    dead.quit = lambda: None
+    core._get_pool(True).put(dead)
+    fresh = make_pooled_driver()
+    monkeypatch.setattr(core, "_build_driver", lambda headless: fresh)
+    assert core.initialize_driver() is fresh